@@ -1,14 +1,24 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rapidfuzz import process, fuzz
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import csv
+import hashlib
 import io
 import os
-import json
+import time
+import orjson
 import re
-import xml.etree.ElementTree as ET
+import threading
+from itertools import islice
+from lxml import etree
+from profiler_core import LOCATION_RE, cms_name_col, normalize_name, public_fields
 
 st.set_page_config(page_title="Healthcare Profiler (CMS + Reviews + News + Business Profile)", layout="wide")
 st.title("Healthcare Org Discovery Profiler v3")
@@ -17,23 +27,209 @@ CMS_URL = (
     "https://data.cms.gov/provider-data/sites/default/files/resources/"
     "893c372430d9d71a1c52737d01239d47_1753409109/Hospital_General_Information.csv"
 )
+CMS_CATEGORY_COLS = [
+    "Hospital Type", "Hospital Ownership", "State", "Emergency Services",
+    "Hospital overall rating", "County Name", "County/Parish",
+]
+# Kept in the user cache dir so the cache survives restarts regardless of the launch directory
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "profiler")
+CMS_CACHE = os.path.join(CACHE_DIR, "cms_cache.parquet")
+CMS_CACHE_META = os.path.join(CACHE_DIR, "cms_cache.json")  # ETag / Last-Modified of the cached download
+CMS_CACHE_TTL = 24 * 3600  # seconds
+CMS_CACHE_VERSION = 2  # bump when _prepare_cms changes the cached columns
+# Per-function bound on cached fetch results; TTLs expire entries, this caps memory between expiries
+FETCH_CACHE_ENTRIES = 256
+
+# -------------------------
+# Shared HTTP Session
+# -------------------------
+class CappedRetry(Retry):
+    # Honour Retry-After on 429/503, but never stall a page render for minutes
+    RETRY_AFTER_CAP = 5  # seconds
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, self.RETRY_AFTER_CAP)
+
+@st.cache_resource
+def get_session():
+    # Cached so keep-alive connections survive Streamlit reruns
+    session = requests.Session()
+    session.headers.update({"User-Agent": "Mozilla/5.0"})
+    # Back off on throttling/server errors, but fail fast when a host is unreachable
+    retry = CappedRetry(total=3, connect=1, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    # Facility websites are not always https, so pool plain http the same way
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+SESSION = get_session()
+
+# -------------------------
+# HTML Parsing
+# -------------------------
+# SoupStrainer arguments for make_soup(only=...): build just the subtrees a parser reads.
+# Class filters are regexes because the strainer sees the raw multi-class attribute string.
+SERP_RESULTS = {"name": "div", "class_": re.compile(r"\btF2Cxc\b")}
+SERP_SPANS = {"name": "span"}
+ABOUT_TAGS = {"name": ["title", "meta", "h1"]}
+
+def make_soup(markup, only=None):
+    # bs4 is only needed once a search runs, so keep its import off the cold-start path.
+    # Callers pass raw bytes: bs4 sniffs the charset from the document itself, which is both
+    # cheaper than requests' text decode and right more often for pages with no charset header
+    from bs4 import BeautifulSoup, SoupStrainer
+    return BeautifulSoup(markup, "lxml", parse_only=SoupStrainer(**only) if only else None)
+
+def fetch_soup(url, params=None, only=None):
+    # Shared GET -> parse step for every scraper
+    r = SESSION.get(url, params=params, timeout=10)
+    r.raise_for_status()
+    return make_soup(r.content, only=only)
+
+# -------------------------
+# Background Fetches
+# -------------------------
+# Fetches are I/O-bound and the executor is shared by every browser session, so size it to the
+# HTTP connection pool rather than the CPU count; this is what bounds concurrent requests
+EXECUTOR_WORKERS = 16
+
+@st.cache_resource
+def get_executor():
+    return ThreadPoolExecutor(max_workers=EXECUTOR_WORKERS, thread_name_prefix="profiler-fetch")
+
+@st.cache_resource
+def get_nested_executor():
+    # For fetches started from a task already running on get_executor(): waiting on a slot of
+    # the pool the caller itself occupies could deadlock once that pool is saturated
+    return ThreadPoolExecutor(max_workers=EXECUTOR_WORKERS, thread_name_prefix="profiler-nested")
+
+def _submit_to(executor, fn, args, kwargs):
+    # Carry the script context over so st.* calls and cached functions inside fn still see it
+    ctx = get_script_run_ctx()
+    def run():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args, **kwargs)
+    return executor.submit(run)
+
+def submit(fn, *args, **kwargs):
+    return _submit_to(get_executor(), fn, args, kwargs)
+
+def submit_nested(fn, *args, **kwargs):
+    return _submit_to(get_nested_executor(), fn, args, kwargs)
 
 # -------------------------
 # Load CMS Data
 # -------------------------
-@st.cache_data
+# cache_resource hands every rerun the same frame; cache_data would unpickle a fresh copy of
+# the whole dataset on each interaction. Callers must treat the frame as read-only.
+@st.cache_resource(show_spinner="Loading CMS data...")
 def load_cms():
+    df = _read_cms()
+    # Downloads are prepared before they are cached; only the backup CSV arrives raw
+    if not df.empty and "_name_norm" not in df.columns:
+        df = _prepare_cms(df)
+    return df
+
+def _prepare_cms(df):
+    # The download path skips footnote columns at parse time; the backup CSV still has them
+    df = df.drop(columns=[c for c in df.columns if "footnote" in c.lower()])
+    # Normalize once here instead of on every search
+    names = df[cms_name_col(df)].fillna("")
+    df["_name_norm"] = names.map(normalize_name)
+    # Arrow-backed so the substring fallback runs in Arrow's kernel, not a Python loop
+    df["_name_lc"] = names.str.lower().astype("string[pyarrow]")
+    # Upper-cased location keys as categories, so the state/city filter compares int codes per
+    # search instead of upper-casing every row. Older CMS extracts call the city column "City".
+    for key, candidates in (("_state_uc", ["State"]), ("_city_uc", ["City/Town", "City"])):
+        col = next((c for c in candidates if c in df.columns), None)
+        if col:
+            df[key] = df[col].str.upper().astype("category")
+    # Low-cardinality columns are stored as categories to cut memory
+    for col in CMS_CATEGORY_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+def _read_cache_meta():
+    # Meta of a cache written by this version of _prepare_cms, else {} so the cache is rebuilt
+    try:
+        with open(CMS_CACHE_META, "rb") as f:
+            meta = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    return meta if meta.get("version") == CMS_CACHE_VERSION else {}
+
+def _cms_usecols(raw):
+    # Footnote columns are bare codes into a CMS legend the app never shows, so skip them at
+    # parse time rather than building and dropping them. Only the header line is decoded.
+    header = next(csv.reader([raw.split(b"\n", 1)[0].decode("utf-8-sig")]))
+    return [c for c in header if "footnote" not in c.lower()]
+
+def _read_cms():
+    meta = _read_cache_meta() if os.path.exists(CMS_CACHE) else {}
+    if meta and time.time() - os.path.getmtime(CMS_CACHE) < CMS_CACHE_TTL:
+        try:
+            # Map the file rather than reading it through a buffer; os.replace on refresh leaves
+            # an open mapping on the old inode, so a concurrent rewrite cannot tear this read
+            df = pd.read_parquet(CMS_CACHE, memory_map=True)
+            st.success(f"Loaded CMS from local cache ({len(df)} records)")
+            return df
+        except Exception as e:
+            st.warning(f"Failed loading CMS cache: {e}")
     try:
-        r = requests.get(CMS_URL, timeout=15)
-        df = pd.read_csv(io.BytesIO(r.content), dtype=str, on_bad_lines="skip")
+        # Revalidate a stale cache so an unchanged file costs one empty 304 response
+        headers = {}
+        if meta:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        r = SESSION.get(CMS_URL, headers=headers, timeout=15)
+        if r.status_code == 304:
+            df = pd.read_parquet(CMS_CACHE, memory_map=True)
+            os.utime(CMS_CACHE)
+            st.success(f"Loaded CMS from local cache, unchanged on server ({len(df)} records)")
+            return df
+        r.raise_for_status()
+        df = pd.read_csv(io.BytesIO(r.content), dtype=str, on_bad_lines="skip", engine="pyarrow",
+                         usecols=_cms_usecols(r.content))
+        # Cache the prepared frame, so warm starts skip name normalization and category casts too
+        df = _prepare_cms(df)
         st.success(f"Loaded CMS from web ({len(df)} records)")
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Write to a temp file and swap it in, so an interrupted write never leaves a torn cache
+            tmp = CMS_CACHE + ".tmp"
+            df.to_parquet(tmp, compression="zstd")
+            os.replace(tmp, CMS_CACHE)
+            meta = {
+                "version": CMS_CACHE_VERSION,
+                "etag": r.headers.get("ETag"),
+                "last_modified": r.headers.get("Last-Modified"),
+            }
+            with open(CMS_CACHE_META, "wb") as f:
+                f.write(orjson.dumps(meta))
+        except Exception as e:
+            st.warning(f"Could not write CMS cache: {e}")
         return df
     except Exception as e:
         st.warning(f"Failed loading CMS from URL: {e}")
+    if meta:
+        # A stale full extract beats the few-row backup CSV when the server cannot be reached
+        try:
+            df = pd.read_parquet(CMS_CACHE, memory_map=True)
+            st.warning(f"Loaded stale CMS cache, revalidation failed ({len(df)} records)")
+            return df
+        except Exception:
+            pass
     if os.path.exists("cms_hospitals_backup.csv"):
         for enc in ["utf-8", "latin1", "utf-16"]:
             try:
-                df = pd.read_csv("cms_hospitals_backup.csv", dtype=str, encoding=enc, on_bad_lines="skip")
+                # Same Arrow parser as the download; a wrong encoding still raises and moves on
+                df = pd.read_csv("cms_hospitals_backup.csv", dtype=str, encoding=enc, on_bad_lines="skip",
+                                 engine="pyarrow")
                 st.success(f"Loaded CMS from local backup ({enc})")
                 return df
             except Exception:
@@ -41,212 +237,364 @@ def load_cms():
     st.error("Cannot load CMS data.")
     return pd.DataFrame()
 
-# -------------------------
-# Normalize Names
-# -------------------------
-def normalize_name(name):
-    name = name.lower()
-    name = re.sub(r'[^\w\s]', '', name)
-    for word in ['hospital', 'medical center', 'center', 'clinic']:
-        name = name.replace(word, '')
-    return name.strip()
-
 # -------------------------
 # Google Pre-Validation
 # -------------------------
+SEARCH_TTL = 3600  # seconds
+# Query strings are passed as params= so requests form-encodes them ('&', '/', '+', non-ASCII)
+GOOGLE_SEARCH_URL = "https://www.google.com/search"
+
+# Each fetch is a cached _*_cached function that raises on failure, so errors are never cached,
+# behind an uncached wrapper that turns the error into an empty result for the page
+@st.cache_data(ttl=SEARCH_TTL, max_entries=FETCH_CACHE_ENTRIES, show_spinner=False)
+def _google_search_cached(name, limit):
+    soup = fetch_soup(GOOGLE_SEARCH_URL, params={"q": name}, only=SERP_RESULTS)
+    results = []
+    # limit= stops the tree walk once enough results are found; each sub-element is looked up once
+    for g in soup.find_all('div', class_='tF2Cxc', limit=limit):
+        h3 = g.find('h3')
+        a = g.find('a', href=True)
+        span = g.find('span', class_='aCOpRe')
+        results.append({
+            "title": h3.get_text() if h3 else '',
+            "link": a['href'] if a else '',
+            "snippet": span.get_text() if span else '',
+        })
+    return results
+
 def google_search_name(name, limit=3):
-    query = requests.utils.quote(name)
-    url = f"https://www.google.com/search?q={query}"
-    headers = {"User-Agent": "Mozilla/5.0"}
     try:
-        r = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(r.text, "html.parser")
-        results = []
-        for g in soup.find_all('div', class_='tF2Cxc')[:limit]:
-            title = g.find('h3').get_text() if g.find('h3') else ''
-            link = g.find('a')['href'] if g.find('a') else ''
-            snippet = g.find('span', class_='aCOpRe').get_text() if g.find('span', class_='aCOpRe') else ''
-            results.append({"title": title, "link": link, "snippet": snippet})
-        return results
+        return _google_search_cached(name, limit)
     except Exception:
         return []
 
 # -------------------------
 # Match Organization
 # -------------------------
-def match_org(name, df, state=None, city=None):
-    df_filtered = df.copy()
-    if state:
-        df_filtered = df_filtered[df_filtered['State'].str.upper() == state.upper()]
-    if city:
-        df_filtered = df_filtered[df_filtered['City'].str.upper() == city.upper()]
-    if df_filtered.empty:
+# WRatio recovers far more CMS names from partial input than token_set_ratio/token_sort_ratio,
+# and the cutoff lets RapidFuzz skip candidates that cannot reach it
+MATCH_SCORER = fuzz.WRatio
+MATCH_CUTOFF = 90
+
+@st.cache_resource(show_spinner=False)
+def name_index(_df, cms_version=None):
+    # Lowercased name -> position of its first row, for O(1) exact-match lookups
+    return dict(zip(_df["_name_lc"][::-1], range(len(_df) - 1, -1, -1)))
+
+@st.cache_resource(show_spinner=False)
+def norm_index(_df, cms_version=None):
+    # Normalized name -> position of its first row. Only identical strings score 100 under
+    # WRatio, so a hit here is exactly what extractOne would return, without scanning every row.
+    # Names that normalize to "" ("Medical Center Hospital") are left out: WRatio scores an empty
+    # query 0, so generic-only input like "clinic" must fall through to the substring search
+    return {n: i for n, i in zip(_df["_name_norm"][::-1], range(len(_df) - 1, -1, -1)) if n}
+
+@st.cache_resource(show_spinner=False)
+def name_choices(_df, cms_version=None):
+    # RapidFuzz scans a plain list several times faster than a Series
+    return _df["_name_norm"].tolist()
+
+@st.cache_resource(show_spinner=False)
+def location_index(_df, key, cms_version=None):
+    # Upper-cased state or city -> sorted row positions, so filtering a search is a dict lookup
+    return _df.groupby(key, observed=True).indices
+
+@st.cache_data(ttl=300, show_spinner=False)
+def match_org(name, _df, state=None, city=None, cms_version=None):
+    # _df is skipped when hashing the cache key; cms_version stands in for it
+    df = _df
+    # Filter by row position rather than copying the filtered frame per search
+    positions = None
+    for value, key in ((state, "_state_uc"), (city, "_city_uc")):
+        if value and key in df:
+            hits = location_index(df, key, cms_version).get(value.upper(), np.empty(0, dtype=np.intp))
+            positions = hits if positions is None else np.intersect1d(positions, hits, assume_unique=True)
+    if positions is None:
+        positions = np.arange(len(df))
+    if positions.size == 0:
         return None, None, "No facilities found with specified state/city"
+    filtered = positions.size != len(df)
+    mask = np.zeros(len(df), dtype=bool)
+    mask[positions] = True
+
+    col = cms_name_col(df)
+    pos = name_index(df, cms_version).get(name.strip().lower())
+    if pos is not None and mask[pos]:
+        row = df.iloc[pos]
+        return row, col, f"Matched '{row[col]}' (exact)"
 
-    name_cols = [c for c in df.columns if "name" in c.lower()]
-    col = name_cols[0]
-    choices = df_filtered[col].dropna().tolist()
-    choices_norm = [normalize_name(c) for c in choices]
     name_norm = normalize_name(name)
+    pos = norm_index(df, cms_version).get(name_norm)
+    if pos is not None and mask[pos]:
+        row = df.iloc[pos]
+        return row, col, f"Matched '{row[col]}' (score 100.0)"
 
-    match = process.extractOne(name_norm, choices_norm, scorer=fuzz.WRatio, score_cutoff=90)
+    choices = name_choices(df, cms_version)
+    if filtered:
+        # Reuse the cached, already-processed strings instead of re-extracting them from the frame
+        choices = [choices[i] for i in positions]
+    # Choices are already normalized, so skip per-choice processing
+    match = process.extractOne(name_norm, choices, scorer=MATCH_SCORER, processor=None,
+                               score_cutoff=MATCH_CUTOFF)
     if match:
         _, score, idx = match
-        return df_filtered.iloc[idx], col, f"Matched '{choices[idx]}' (score {score})"
+        row = df.iloc[positions[idx]]
+        return row, col, f"Matched '{row[col]}' (score {score})"
     
-    subs = df_filtered[df_filtered[col].str.contains(name, case=False, na=False)]
-    if not subs.empty:
-        return subs.iloc[0], col, f"Substring fallback: '{subs.iloc[0][col]}'"
+    # Only the first hit is used, so take it from the mask instead of slicing a sub-frame
+    names_lc = df["_name_lc"].iloc[positions] if filtered else df["_name_lc"]
+    hits = names_lc.str.contains(name.strip().lower(), regex=False).to_numpy(dtype=bool, na_value=False)
+    if hits.any():
+        row = df.iloc[positions[hits.argmax()]]
+        return row, col, f"Substring fallback: '{row[col]}'"
     return None, col, "No match found"
 
+def match_orgs(names, df, score_cutoff=MATCH_CUTOFF):
+    # Batch variant of match_org: the same exact and normalized lookups first, then every
+    # remaining name is scored against every CMS row in one cdist call
+    if df.empty:
+        return [None] * len(names)
+    exact, norm = name_index(df, len(df)), norm_index(df, len(df))
+    hits = []
+    for n in names:
+        pos = exact.get(n.strip().lower())
+        if pos is None:
+            q = normalize_name(n)
+            pos = norm.get(q, q)
+        hits.append(pos)
+    # Unresolved names are left as their normalized query. Batch inputs repeat names (spelling
+    # variants normalize alike), so score each distinct query once
+    pending = list(dict.fromkeys(h for h in hits if isinstance(h, str)))
+    best = {}
+    if pending:
+        scores = process.cdist(pending, name_choices(df, len(df)), scorer=MATCH_SCORER, processor=None,
+                               score_cutoff=score_cutoff, dtype=np.uint8, workers=-1)
+        best = {
+            q: idx if scores[i, idx] else None
+            for i, (q, idx) in enumerate(zip(pending, scores.argmax(axis=1)))
+        }
+    hits = [best[h] if isinstance(h, str) else h for h in hits]
+    return [None if h is None else df.iloc[h] for h in hits]
+
 # -------------------------
 # Fetch News
 # -------------------------
+NEWS_TTL = 3600  # seconds; the feed changes at most hourly
+NEWS_RSS_URL = "https://news.google.com/rss/search"
+
+@st.cache_data(ttl=NEWS_TTL, max_entries=FETCH_CACHE_ENTRIES, show_spinner=False)
+def _fetch_news_cached(name, limit):
+    r = SESSION.get(NEWS_RSS_URL, params={"q": name}, timeout=10)
+    r.raise_for_status()
+    # Stream the feed and stop after `limit` items instead of building the whole tree
+    events = etree.iterparse(io.BytesIO(r.content), tag="item", resolve_entities=False, no_network=True)
+    items = []
+    for _, item in islice(events, limit):
+        items.append({
+            "title": item.findtext("title", "").strip(),
+            "link": item.findtext("link", "").strip(),
+            "date": item.findtext("pubDate", "").strip(),
+        })
+        item.clear()
+    return items
+
 def fetch_news(name, limit=5):
-    url = f"https://news.google.com/rss/search?q={requests.utils.quote(name)}"
     try:
-        r = requests.get(url, timeout=10)
-        root = ET.fromstring(r.content)
-        items = root.findall(".//item")[:limit]
-        return [
-            {"title": i.find("title").text, "link": i.find("link").text, "date": i.find("pubDate").text}
-            for i in items
-        ]
+        return _fetch_news_cached(name, limit)
     except Exception:
         return []
 
 # -------------------------
 # Fetch Reviews & Google Business Info
 # -------------------------
+PLACES_SEARCH_URL = "https://maps.googleapis.com/maps/api/place/textsearch/json"
+PLACES_DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
+PLACES_DETAILS_FIELDS = (
+    "name,reviews,formatted_address,rating,user_ratings_total,formatted_phone_number,"
+    "international_phone_number,website,opening_hours,geometry,types,place_id"
+)
+
+REVIEWS_TTL = 6 * 3600  # seconds
+# Places statuses that mean "answered"; anything else (quota, denied key) is an error worth retrying
+PLACES_OK = {"OK", "ZERO_RESULTS"}
+
+@st.cache_data(ttl=REVIEWS_TTL, max_entries=FETCH_CACHE_ENTRIES, show_spinner=False)
+def _fetch_place_cached(name, _api_key, key_id):
+    # _api_key is left out of the cache key; key_id, its digest, keeps results apart per key
+    api_key = _api_key
+    search_resp = SESSION.get(PLACES_SEARCH_URL, params={"query": name, "key": api_key}, timeout=10)
+    search_resp.raise_for_status()
+    search_json = search_resp.json()
+    if search_json.get("status") not in PLACES_OK:
+        raise RuntimeError(search_json.get("error_message") or search_json.get("status"))
+    results = search_json.get("results", [])
+    if not results:
+        return {}
+    place = results[0]
+    place_id = place.get("place_id")
+    if not place_id:
+        return place
+    details_resp = SESSION.get(
+        PLACES_DETAILS_URL,
+        params={"place_id": place_id, "fields": PLACES_DETAILS_FIELDS, "key": api_key},
+        timeout=10,
+    )
+    details_resp.raise_for_status()
+    details_json = details_resp.json()
+    if details_json.get("status") not in PLACES_OK:
+        raise RuntimeError(details_json.get("error_message") or details_json.get("status"))
+    return details_json.get("result", {})
+
+@st.cache_data(ttl=REVIEWS_TTL, max_entries=FETCH_CACHE_ENTRIES, show_spinner=False)
+def _fetch_review_snippets_cached(name, limit):
+    soup = fetch_soup(GOOGLE_SEARCH_URL, params={"q": f"{name} reviews"}, only=SERP_SPANS)
+    # Lazily walk leaf spans only: a parent span's text just repeats its children's
+    texts = (span.get_text() for span in soup.css.iselect("span:not(:has(span))"))
+    return list(islice((t for t in texts if len(t) > 20), limit))
+
 def fetch_reviews(name, api_key=None, max_reviews=25):
+    # Runs on a worker thread, so a Places failure is returned for the caller to render in place
     reviews_data = []
     place = {}
+    error = None
+
+    # The snippet search does not depend on the Places API calls, so run it alongside them.
+    # This usually runs on the shared executor already, hence the nested pool
+    snippets_future = submit_nested(_fetch_review_snippets_cached, name, max_reviews)
 
     if api_key:
         try:
-            search_url = (
-                f"https://maps.googleapis.com/maps/api/place/textsearch/json?"
-                f"query={requests.utils.quote(name)}&key={api_key}"
-            )
-            search_resp = requests.get(search_url, timeout=10).json()
-            results = search_resp.get("results", [])
-            if results:
-                place = results[0]
-                place_id = place.get("place_id")
-                if place_id:
-                    details_url = (
-                        f"https://maps.googleapis.com/maps/api/place/details/json?"
-                        f"place_id={place_id}&fields=name,reviews,formatted_address,rating,"
-                        f"user_ratings_total,formatted_phone_number,international_phone_number,"
-                        f"website,opening_hours,geometry,types,place_id&key={api_key}"
-                    )
-                    details_resp = requests.get(details_url, timeout=10).json()
-                    place = details_resp.get("result", {})
-                    for r in place.get("reviews", []):
-                        reviews_data.append({
-                            "name": place.get("name"),
-                            "address": place.get("formatted_address"),
-                            "rating": r.get("rating"),
-                            "user_ratings_total": place.get("user_ratings_total"),
-                            "author_name": r.get("author_name"),
-                            "review_text": r.get("text"),
-                            "time": datetime.utcfromtimestamp(r.get("time")).isoformat() if r.get("time") else None
-                        })
+            place = _fetch_place_cached(name, api_key, hashlib.sha256(api_key.encode()).hexdigest())
+            for r in place.get("reviews", []):
+                reviews_data.append({
+                    "name": place.get("name"),
+                    "address": place.get("formatted_address"),
+                    "rating": r.get("rating"),
+                    "user_ratings_total": place.get("user_ratings_total"),
+                    "author_name": r.get("author_name"),
+                    "review_text": r.get("text"),
+                    "time": datetime.utcfromtimestamp(r.get("time")).isoformat() if r.get("time") else None
+                })
         except Exception as e:
-            st.warning(f"Failed to fetch reviews from API: {e}")
+            error = e
 
     if len(reviews_data) < max_reviews:
         try:
             remaining = max_reviews - len(reviews_data)
-            query = requests.utils.quote(name + " reviews")
-            r = requests.get(f"https://www.google.com/search?q={query}", headers={"User-Agent":"Mozilla/5.0"}, timeout=10)
-            soup = BeautifulSoup(r.text, "html.parser")
-            snippets = [span.get_text() for span in soup.find_all("span") if len(span.get_text()) > 20][:remaining]
-            for s in snippets:
-                reviews_data.append({
-                    "name": place.get("name") if place else None,
-                    "address": place.get("formatted_address") if place else None,
-                    "rating": None,
-                    "user_ratings_total": place.get("user_ratings_total") if place else None,
-                    "author_name": None,
-                    "review_text": s,
-                    "time": None
-                })
+            snippets = snippets_future.result()[:remaining]
+            # Place fields are the same for every snippet, so look them up once
+            base = {
+                "name": place.get("name"),
+                "address": place.get("formatted_address"),
+                "rating": None,
+                "user_ratings_total": place.get("user_ratings_total"),
+                "author_name": None,
+                "review_text": None,
+                "time": None
+            }
+            reviews_data.extend({**base, "review_text": s} for s in snippets)
         except Exception:
             pass
 
-    return reviews_data[:max_reviews], place
+    return reviews_data[:max_reviews], place, error
 
 # -------------------------
 # Scrape Website for About Info
 # -------------------------
+ABOUT_TTL = 6 * 3600  # seconds
+
+@st.cache_data(ttl=ABOUT_TTL, max_entries=FETCH_CACHE_ENTRIES, show_spinner=False)
+def _scrape_about_cached(website_url):
+    soup = fetch_soup(website_url, only=ABOUT_TAGS)
+    # Each tag is looked up once; find() already stops at the first match
+    title_tag = soup.title
+    title = title_tag.get_text().strip() if title_tag else ""
+    meta_desc = ""
+    desc_tag = soup.find("meta", attrs={"name":"description"}) or soup.find("meta", attrs={"property":"og:description"})
+    if desc_tag and desc_tag.get("content"):
+        meta_desc = desc_tag["content"].strip()
+    h1 = soup.find("h1")
+    h1_text = h1.get_text().strip() if h1 else ""
+    return {"title": title, "meta_description": meta_desc, "h1": h1_text, "url": website_url}
+
 def scrape_about(website_url):
     if not website_url:
         return {}
     try:
-        r = requests.get(website_url, headers={"User-Agent":"Mozilla/5.0"}, timeout=10)
-        soup = BeautifulSoup(r.text, "html.parser")
-        title = soup.title.string.strip() if soup.title else ""
-        meta_desc = ""
-        desc_tag = soup.find("meta", attrs={"name":"description"}) or soup.find("meta", attrs={"property":"og:description"})
-        if desc_tag and desc_tag.get("content"):
-            meta_desc = desc_tag["content"].strip()
-        h1_text = soup.find("h1").get_text().strip() if soup.find("h1") else ""
-        return {"title": title, "meta_description": meta_desc, "h1": h1_text, "url": website_url}
+        return _scrape_about_cached(website_url)
     except Exception:
         return {}
 
+def fetch_reviews_and_about(name, api_key=None, max_reviews=25):
+    # The website scrape only needs the Places result, so chain it onto the review fetch
+    revs, place, error = fetch_reviews(name, api_key, max_reviews=max_reviews)
+    return revs, place, scrape_about(place.get("website")), error
+
 # -------------------------
 # Main App
 # -------------------------
 df_cms = load_cms()
 
-org = st.text_input("Organization Name (e.g., UCSF Medical Center)")
-gkey = st.text_input("Google Places API Key (optional)", type="password")
-search_button = st.button("Search")
+# A form holds keystrokes client-side, so typing no longer reruns the script; only Search does
+with st.form("search_form"):
+    org = st.text_input("Organization Name (e.g., UCSF Medical Center)")
+    gkey = st.text_input("Google Places API Key (optional)", type="password")
+    search_button = st.form_submit_button("Search")
 
 if org and search_button:
-    with st.spinner("Validating via Google search..."):
-        google_hits = google_search_name(org, limit=3)
-        st.subheader("Top Google Search Hits")
-        for hit in google_hits:
-            st.markdown(f"- [{hit['title']}]({hit['link']}) — {hit['snippet']}")
-
-        city, state = None, None
-        for hit in google_hits:
-            snippet = hit['snippet']
-            match_loc = re.search(r'\b([A-Za-z\s]+),\s([A-Z]{2})\b', snippet)
-            if match_loc:
-                city, state = match_loc.group(1), match_loc.group(2)
-                break
-
-    with st.spinner("Matching organization..."):
-        match, name_col, msg = match_org(org, df_cms, state=state, city=city)
-        st.info(msg)
-
-    if match is not None:
+    # Canonicalize once per click: case and spacing variants of a name then share every fetch
+    # and match cache below instead of each helper re-deriving its own key
+    query = " ".join(org.lower().split())
+
+    # One status element for the whole run; its label is updated in place at each step
+    # instead of mounting and tearing down a separate spinner per stage
+    status = st.status("Validating via Google search...")
+    google_hits = google_search_name(query, limit=3)
+    st.subheader("Top Google Search Hits")
+    # One markdown element per list, rather than one per line
+    st.markdown("\n".join(f"- [{hit['title']}]({hit['link']}) — {hit['snippet']}" for hit in google_hits))
+
+    city, state = None, None
+    for hit in google_hits:
+        snippet = hit['snippet']
+        match_loc = LOCATION_RE.search(snippet)
+        if match_loc:
+            city, state = match_loc.group(1), match_loc.group(2)
+            break
+
+    status.update(label="Matching organization...")
+    match, name_col, msg = match_org(query, df_cms, state=state, city=city, cms_version=len(df_cms))
+    st.info(msg)
+
+    if match is None:
+        status.update(label="No matching facility", state="error")
+    else:
+        # Start the news feed as soon as the name is known so it downloads while the facility renders
+        news_future = submit(fetch_news, match.get("Hospital Name") or match[name_col], limit=5)
+        # Reviews are only fetched for a matched facility, so a miss makes no Places calls
+        reviews_future = submit(fetch_reviews_and_about, query, gkey, max_reviews=25)
+
         st.subheader("Facility Info")
-        st.json(match.to_dict())
+        facility = public_fields(match).to_dict()
+        st.json(facility)
 
-        with st.spinner("Fetching Google News..."):
-            news = fetch_news(match.get("Hospital Name") or match[name_col], limit=5)
+        status.update(label="Fetching Google News...")
+        news = news_future.result()
         st.subheader("Recent News")
-        for n in news:
-            st.markdown(f"- [{n['title']}]({n['link']}) — {n['date']}")
+        st.markdown("\n".join(f"- [{n['title']}]({n['link']}) — {n['date']}" for n in news))
 
-        with st.spinner("Fetching Reviews and Business Profile..."):
-            revs, place_info = fetch_reviews(org, gkey, max_reviews=25)
+        status.update(label="Fetching Reviews and Business Profile...")
+        revs, place_info, about_data, reviews_error = reviews_future.result()
 
         st.subheader("Reviews Table")
+        if reviews_error:
+            st.warning(f"Failed to fetch reviews from API: {reviews_error}")
         if revs:
-            df_revs = pd.DataFrame(revs)
             expected_cols = ["name", "author_name", "rating", "user_ratings_total", "address", "review_text", "time"]
-            for col in expected_cols:
-                if col not in df_revs.columns:
-                    df_revs[col] = None
-            if "rating" in df_revs.columns and df_revs["rating"].notna().any():
+            df_revs = pd.DataFrame(revs).reindex(columns=expected_cols)
+            if df_revs["rating"].notna().any():
                 df_revs = df_revs.sort_values("rating", ascending=True)
-            st.dataframe(df_revs[expected_cols].head(25))
+            st.dataframe(df_revs.head(25))
         else:
             st.info("No reviews found.")
 
@@ -266,35 +614,34 @@ if org and search_button:
                 "place_id": place_info.get("place_id")
             })
 
-        about_data = scrape_about(place_info.get("website") if place_info else None)
         if about_data:
             st.subheader("About Information (Scraped from Website)")
             st.json(about_data)
 
-        with st.spinner("Calculating Business Performance / Reputation Score..."):
-            try:
-                if place_info:
-                    rating = place_info.get("rating", 0)
-                    total_reviews = place_info.get("user_ratings_total", 1)
-                    rep_score = round(rating * min(total_reviews / 100, 1) * 20, 2)
-                    st.subheader("Business Performance / Reputation Score")
-                    st.markdown(f"- **Score (0-20)**: {rep_score}")
-                    st.markdown(f"- **Rating**: {rating} / 5")
-                    st.markdown(f"- **Total Reviews**: {total_reviews}")
-                else:
-                    st.info("Google Places API key required to calculate reputation score.")
-            except Exception as e:
-                st.warning(f"Could not calculate performance score: {e}")
-                
+        try:
+            if place_info:
+                rating = place_info.get("rating", 0)
+                total_reviews = place_info.get("user_ratings_total", 1)
+                rep_score = round(rating * min(total_reviews / 100, 1) * 20, 2)
+                st.subheader("Business Performance / Reputation Score")
+                st.markdown(
+                    f"- **Score (0-20)**: {rep_score}\n"
+                    f"- **Rating**: {rating} / 5\n"
+                    f"- **Total Reviews**: {total_reviews}"
+                )
+            else:
+                st.info("Google Places API key required to calculate reputation score.")
+        except Exception as e:
+            st.warning(f"Could not calculate performance score: {e}")
 
+        status.update(label="Profile ready", state="complete")
 
-        
         # -------------------------
         # Download Full Profile
         # -------------------------
         profile_data = {
             "org_input": org,
-            "matched_name": match.get("Hospital Name") or match.to_dict(),
+            "matched_name": match.get("Hospital Name") or facility,
             "news": news,
             "reviews": revs,
             "business_profile": place_info,
@@ -303,13 +650,18 @@ if org and search_button:
         }
         
         st.subheader("Download Full Profile")
+        # Downloads are served from the bytes built here; on_click="ignore" stops a click from
+        # rerunning the script, which would redo every fetch and clear the results page
+        file_stem = normalize_name(org)
         # JSON
-        json_bytes = json.dumps(profile_data, indent=2).encode('utf-8')
+        # Numpy scalars from the CMS row serialize natively instead of falling back to str()
+        json_bytes = orjson.dumps(profile_data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
         st.download_button(
             label="Download Full Profile as JSON",
             data=json_bytes,
-            file_name=f"{normalize_name(org)}_profile.json",
-            mime="application/json"
+            file_name=f"{file_stem}_profile.json",
+            mime="application/json",
+            on_click="ignore"
         )
         # CSV (reviews only)
         if revs:
@@ -318,6 +670,7 @@ if org and search_button:
             st.download_button(
                 label="Download Reviews as CSV",
                 data=csv_bytes,
-                file_name=f"{normalize_name(org)}_reviews.csv",
-                mime="text/csv"
+                file_name=f"{file_stem}_reviews.csv",
+                mime="text/csv",
+                on_click="ignore"
             )
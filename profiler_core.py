@@ -0,0 +1,27 @@
+import re
+from functools import lru_cache
+
+# Pure helpers live here rather than in profiler.py: Streamlit re-executes the app
+# script on every interaction, but an imported module is only loaded once, so these
+# compiled patterns and the normalize_name memo survive reruns.
+
+# -------------------------
+# Normalize Names
+# -------------------------
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_GENERIC_WORDS_RE = re.compile(r'hospital|medical center|center|clinic')
+LOCATION_RE = re.compile(r'\b([A-Za-z\s]+),\s([A-Z]{2})\b')
+
+@lru_cache(maxsize=8192)
+def normalize_name(name):
+    # Runs over every CMS row at load, so use one precompiled pass per step;
+    # memoized because repeated names (CMS duplicates, batch queries) give the same result
+    name = _PUNCT_RE.sub('', name.lower())
+    name = _GENERIC_WORDS_RE.sub('', name)
+    return name.strip()
+
+def cms_name_col(df):
+    return [c for c in df.columns if "name" in c.lower() and not c.startswith("_")][0]
+
+def public_fields(row):
+    return row.drop(labels=[c for c in row.index if c.startswith("_")])
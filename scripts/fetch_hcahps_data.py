@@ -1,9 +1,11 @@
-import requests
+from ._http import make_session
+
+SESSION = make_session()
 
 def fetch_hcahps_data(hospital_id):
     url = f"https://data.cms.gov/provider-data/api/1/datastore/query/hospitals/{hospital_id}/hcahps"
     try:
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=10)
         data = response.json()
         # Extract relevant information
         hcahps_scores = {
@@ -1,12 +1,17 @@
-import requests
-from bs4 import BeautifulSoup
+import re
+from bs4 import BeautifulSoup, SoupStrainer
+from ._http import make_session
+
+SESSION = make_session()
+
+USNEWS_SEARCH_URL = "https://health.usnews.com/best-hospitals/search"
+# Build only the ranking/specialty divs
+RANKING_DIVS = SoupStrainer("div", class_=re.compile(r"\b(?:ranking|specialty)\b"))
 
 def fetch_usnews_rankings(hospital_name):
-    url = f"https://health.usnews.com/best-hospitals/search?hospital_name={hospital_name.replace(' ', '+')}"
-    headers = {"User-Agent": "Mozilla/5.0"}
     try:
-        response = requests.get(url, headers=headers)
-        soup = BeautifulSoup(response.text, "html.parser")
+        response = SESSION.get(USNEWS_SEARCH_URL, params={"hospital_name": hospital_name}, timeout=10)
+        soup = BeautifulSoup(response.content, "lxml", parse_only=RANKING_DIVS)
         # Extract relevant information
         ranking = soup.find("div", class_="ranking").text.strip()
         specialties = [specialty.text.strip() for specialty in soup.find_all("div", class_="specialty")]
@@ -1,18 +1,18 @@
-import requests
-from bs4 import BeautifulSoup
+import re
+from bs4 import BeautifulSoup, SoupStrainer
+from ._http import make_session
+
+SESSION = make_session()
+
+YELP_SEARCH_URL = "https://www.yelp.com/search"
+# Build only the review paragraphs
+REVIEW_PARAGRAPHS = SoupStrainer("p", class_=re.compile(r"\bcomment__09f24__gu0rG\b"))
 
 def fetch_yelp_reviews(hospital_name, location="San Francisco, CA", limit=5):
     query = f"{hospital_name} {location} reviews"
-    url = f"https://www.yelp.com/search?find_desc={query.replace(' ', '+')}"
-    headers = {"User-Agent": "Mozilla/5.0"}
     try:
-        response = requests.get(url, headers=headers)
-        soup = BeautifulSoup(response.text, "html.parser")
-        reviews = []
-        for review in soup.find_all("p", class_="comment__09f24__gu0rG"):
-            reviews.append(review.text.strip())
-            if len(reviews) >= limit:
-                break
-        return reviews
+        response = SESSION.get(YELP_SEARCH_URL, params={"find_desc": query}, timeout=10)
+        soup = BeautifulSoup(response.content, "lxml", parse_only=REVIEW_PARAGRAPHS)
+        return [review.text.strip() for review in soup.find_all("p", limit=limit)]
     except Exception as e:
         return [f"Failed to fetch reviews: {e}"]